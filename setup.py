@@ -4,10 +4,41 @@ Package configuration for To LLM View.
 This module defines the package setup configuration for distribution.
 """
 
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py as _build_py
 
 from src.info import VERSION
 
+
+class build_py(_build_py):
+    """
+    Build command that also generates converters manifest.
+    
+    Installed package reads converter names from the manifest instead of
+    scanning converters directory on every start. Mirrors discovery rules
+    of src.utils.iter_process_types.
+    """
+
+    def run(self):
+        super().run()
+        
+        converters_dir = os.path.join(self.build_lib, "src", "converters")
+        names = []
+        
+        for root, dirs, files in os.walk(converters_dir):
+            dirs[:] = sorted(d for d in dirs if d[0] != "_")
+            
+            rel_path = os.path.relpath(root, converters_dir)
+            prefix = "" if rel_path == os.curdir else rel_path.replace(os.sep, ".") + "."
+            
+            names.extend(prefix + f.split(".")[0] for f in sorted(files) if f[0] != "_" and f.split(".")[-1] == "py")
+        
+        with open(os.path.join(converters_dir, "_manifest.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(names) + "\n")
+
+
 setup(
     name="to-llm-view",
     version=VERSION,
@@ -15,6 +46,12 @@ setup(
     install_requires=[
         "colorama"
     ],
+    extras_require={
+        "json": ["orjson"],
+    },
+    cmdclass={
+        "build_py": build_py,
+    },
     entry_points={
         "console_scripts": [
             "to-llm-view = src.main:main",
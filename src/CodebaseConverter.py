@@ -10,14 +10,13 @@ for conversion to a unified text format.
 import os
 import subprocess
 import sys
-from pathlib import Path
-from typing import List, Set, Optional
+import tempfile
+from typing import Iterable, Iterator, List, Set, Optional, Tuple
 from datetime import datetime
 import re
-from colorama import Fore, Back, Style
 
 from src.info import VERSION
-from src.utils import eprint, filler
+from src.utils import Back, Fore, Style, compile_regex, eprint, filler
 
 
 class CodebaseFileGetter:
@@ -27,49 +26,104 @@ class CodebaseFileGetter:
     This class handles Git operations and provides various filtering methods
     to select specific files from the codebase.
     """
+    
+    def __init__(self, use_git: bool = True):
+        """
+        Initialize file getter.
+        
+        Args:
+            use_git: List files known to Git, otherwise walk current directory
+        """
+        self.use_git = use_git
+        self.found_files = 0
+        self._git_files: Optional[Tuple[str, ...]] = None
         
-    def get_git_files(self) -> List[str]:
+    def _run_git_list(self, args: List[str]) -> Iterator[str]:
         """
-        Get file list from Git repository.
+        Run git listing command with NUL separated output, streaming its paths.
         
-        Uses 'git ls-tree' command to retrieve all files tracked by Git.
+        Output is read from the pipe in chunks while git is still running and
+        split as bytes, which also keeps filenames with newlines or non-ASCII
+        characters intact (no git path quoting).
         
-        Returns:
-            List[str]: List of file paths in repository
+        Args:
+            args: Git arguments, must include '-z'
+            
+        Yields:
+            str: File paths
             
         Raises:
             subprocess.CalledProcessError: If git command fails
-            FileNotFoundError: If git is not installed
         """
-        try:
-            # Execute git ls-tree to get file list
-            result = subprocess.run(
-                ["git", "ls-tree", "-r", "HEAD", "--name-only"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Split output by lines and remove empty lines
-            files = [line.strip() for line in result.stdout.split('\n') if line.strip()]
-            
-            
-            # Get new files
-            result = subprocess.run(
-                ["git", "ls-files", "--others", "--exclude-standard"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+        # Stderr goes to a file, not a pipe: git may write lots of warnings
+        # (e.g. unreadable directories) and would block on a full pipe while
+        # stdout is still being read
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                ["git"] + args,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            ) as process:
+                # Last path of a chunk may be cut, it is completed by the next one
+                tail = b""
+                
+                for chunk in iter(lambda: process.stdout.read1(1 << 16), b""):
+                    paths = (tail + chunk).split(b'\0')
+                    tail = paths.pop()
+                    
+                    for path in paths:
+                        if path:
+                            yield path.decode('utf-8', 'surrogateescape')
+                
+                if tail:
+                    yield tail.decode('utf-8', 'surrogateescape')
             
-            files.extend([line.strip() for line in result.stdout.split('\n') if line.strip()])
+            # Process has exited here, so stderr is complete
+            if process.returncode:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(process.returncode, ["git"] + args, stderr=stderr_file.read())
+
+    @staticmethod
+    def _skip_repeated(files: Iterable[str]) -> Iterator[str]:
+        """
+        Drop paths repeating the previous one.
+        
+        Git index lists unmerged paths once per conflict stage, and stages of
+        a path always come one after another.
+        
+        Args:
+            files: File paths from Git
             
+        Yields:
+            str: File paths without adjacent repeats
+        """
+        prev = None
+        
+        for file_path in files:
+            if file_path != prev:
+                yield file_path
+                prev = file_path
+
+    def _list_git_files(self) -> Iterator[str]:
+        """
+        Lazily list files from Git repository.
+        
+        Uses 'git ls-files' command to retrieve all files tracked by Git
+        and new files not ignored by .gitignore.
+        
+        Yields:
+            str: File paths in repository
             
-            print(f"{Fore.LIGHTGREEN_EX}✓ Found {Fore.LIGHTBLUE_EX}{len(files)} {Fore.LIGHTGREEN_EX}files in Git repository{Style.RESET_ALL}")
-            return files
+        Raises:
+            subprocess.CalledProcessError: If git command fails
+            FileNotFoundError: If git is not installed
+        """
+        try:
+            # Tracked and new files are listed by a single git process
+            yield from self._skip_repeated(self._run_git_list(["ls-files", "-z", "--cached", "--others", "--exclude-standard"]))
             
         except subprocess.CalledProcessError as e:
-            error_msg = f"Git command error: {e.stderr}"
+            error_msg = f"Git command error: {e.stderr.decode('utf-8', 'replace')}"
             eprint(f"✗ {error_msg}")
             raise
             
@@ -78,6 +132,91 @@ class CodebaseFileGetter:
             eprint(f"✗ {error_msg}")
             raise
 
+    def get_git_files(self) -> Iterator[str]:
+        """
+        Lazily get file list from Git repository.
+        
+        First complete listing is kept for the lifetime of the getter, so
+        repeated calls (e.g. several converters in one run) don't query Git again.
+        
+        Yields:
+            str: File paths in repository
+            
+        Raises:
+            subprocess.CalledProcessError: If git command fails
+            FileNotFoundError: If git is not installed
+        """
+        if self._git_files is not None:
+            yield from self._git_files
+            return
+        
+        # Paths are still streamed on the first call, they are only collected on the way
+        files = []
+        
+        for file_path in self._list_git_files():
+            files.append(file_path)
+            yield file_path
+        
+        self._git_files = tuple(files)
+
+    def get_local_files(self) -> Iterator[str]:
+        """
+        Lazily get file list from current directory without spawning Git.
+        
+        Uses an explicit stack instead of recursion. os.scandir entries carry
+        file type, so no extra stat call is made per file.
+        
+        Yields:
+            str: File paths relative to current directory, separated with '/' like in Git
+        """
+        stack = [""]
+        
+        while stack:
+            prefix = stack.pop()
+            
+            try:
+                entries = os.scandir(prefix or ".")
+            except OSError as e:
+                eprint(f"✗ Can't read directory {prefix}: {e.strerror}")
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            stack.append(prefix + entry.name + "/")
+                    elif entry.is_file():
+                        yield prefix + entry.name
+
+    def _count_found(self, files: Iterable[str]) -> Iterator[str]:
+        """
+        Pass files through, counting them into found_files.
+        
+        Args:
+            files: File paths from Git or directory walk
+            
+        Yields:
+            str: Same file paths
+        """
+        for file_path in files:
+            self.found_files += 1
+            yield file_path
+
+    @staticmethod
+    def _extension_suffixes(extensions: Set[str]) -> Tuple[str, ...]:
+        """
+        Normalize extensions into lowercase suffixes tuple.
+        
+        str.endswith with a tuple checks all extensions in one C call.
+        
+        Args:
+            extensions: Set of extensions (e.g., {'.py', 'js'})
+            
+        Returns:
+            Tuple[str, ...]: Lowercase extensions with dots (e.g., ('.py', '.js'))
+        """
+        return tuple(ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in extensions)
+
     def filter_files_by_extensions(self, files: List[str], extensions: Set[str]) -> List[str]:
         """
         Filter files by extensions.
@@ -91,13 +230,9 @@ class CodebaseFileGetter:
         """
         if not extensions:
             return files
-            
-        filtered_files = []
-        for file_path in files:
-            file_ext = Path(file_path).suffix.lower()
-            if file_ext in extensions:
-                filtered_files.append(file_path)
-                
+        
+        filtered_files = list(self._apply_filters(files, extensions, None, None))
+        
         print(f"{Fore.LIGHTYELLOW_EX}✓ After extension filtering: {Fore.LIGHTMAGENTA_EX}{len(filtered_files)} {Fore.LIGHTYELLOW_EX}files remaining{Style.RESET_ALL}")
         return filtered_files
     
@@ -118,16 +253,101 @@ class CodebaseFileGetter:
         Returns:
             List[str]: Filtered file list
         """
-        
-        filtered_files = []
-        for file_path in files:
-            if 	(bregex is None or not bregex.match(file_path)) and \
-                (wregex is None or wregex.match(file_path)):
-                filtered_files.append(file_path)
+        filtered_files = list(self._apply_filters(files, None, bregex, wregex))
         
         print(f"{Fore.LIGHTYELLOW_EX}✓ After Regex filtering: {Fore.LIGHTCYAN_EX}{len(filtered_files)} {Fore.LIGHTYELLOW_EX}files remaining{Style.RESET_ALL}")
         return filtered_files
 
+    @staticmethod
+    def _combine_regex(bregex: Optional[re.Pattern], wregex: Optional[re.Pattern]) -> Optional[re.Pattern]:
+        """
+        Union blacklist and whitelist Regex into a single pattern.
+        
+        '(?!(?:blacklist))(?:whitelist)' matches exactly when blacklist doesn't
+        match and whitelist does, so every path is checked with one match call.
+        Combined pattern is cached by compile_regex.
+        
+        Args:
+            bregex: Regex pattern for blacklist (exclude) filtering
+            wregex: Regex pattern for whitelist (include) filtering
+            
+        Returns:
+            Optional[re.Pattern]: Combined pattern, None if there is nothing to combine
+                or patterns can't be combined safely (different flags, blacklist
+                groups that would shift whitelist group references, inline global flags)
+        """
+        if bregex is None:
+            return wregex
+        
+        # Blacklist groups would renumber whitelist groups, breaking its
+        # backreferences and conditional group references
+        if bregex.groups or (wregex is not None and bregex.flags != wregex.flags):
+            return None
+        
+        pattern = f"(?!(?:{bregex.pattern}))"
+        
+        if wregex is not None:
+            pattern += f"(?:{wregex.pattern})"
+        
+        try:
+            return compile_regex(pattern, bregex.flags)
+        except re.error:
+            return None
+
+    def _apply_filters(
+        self, 
+        files: List[str], 
+        extensions: Optional[Set[str]], 
+        bregex: Optional[re.Pattern], 
+        wregex: Optional[re.Pattern]
+    ) -> Iterator[str]:
+        """
+        Lazily apply extension and Regex filters in a single pass.
+        
+        Same rules as filter_files_by_extensions and filter_files_by_regex,
+        but the file list is traversed only once.
+        
+        Args:
+            files: List of file paths
+            extensions: Set of extensions to filter by
+            bregex: Regex pattern for blacklist (exclude) filtering
+            wregex: Regex pattern for whitelist (include) filtering
+            
+        Yields:
+            str: File paths passing all filters
+        """
+        suffixes = self._extension_suffixes(extensions) if extensions else None
+        
+        # Cheap extension check always runs first, so Regex only sees files
+        # that passed it. Memoizing match results doesn't help here: every
+        # path is matched exactly once, so such cache would never be hit.
+        
+        # Blacklist and whitelist are checked with one combined pattern when possible
+        combined = self._combine_regex(bregex, wregex)
+        
+        if combined is not None:
+            match = combined.match
+            
+            if suffixes is None:
+                # Whole loop runs in C
+                yield from filter(match, files)
+                return
+            
+            for file_path in files:
+                if file_path.lower().endswith(suffixes) and match(file_path):
+                    yield file_path
+            return
+        
+        # Bound methods skip attribute lookup for every file
+        bmatch = bregex.match if bregex is not None else None
+        wmatch = wregex.match if wregex is not None else None
+        
+        for file_path in files:
+            if 	(suffixes is None or file_path.lower().endswith(suffixes)) and \
+                (bmatch is None or not bmatch(file_path)) and \
+                (wmatch is None or wmatch(file_path)):
+                yield file_path
+
     def convert(
         self, 
         extensions: Optional[Set[str]] = None, 
@@ -143,7 +363,7 @@ class CodebaseFileGetter:
             wregex: Regex pattern for whitelist filtering
             
         Returns:
-            List[str]: Filtered list of file paths
+            List[str]: Filtered list of file paths, sorted by path parts
             
         Raises:
             SystemExit: If critical error occurs during processing
@@ -151,15 +371,28 @@ class CodebaseFileGetter:
         try:
             print(f"🚀 Starting codebase getter...")
             
-            # Get file list from Git
-            files = self.get_git_files()
+            # File list is pulled lazily from Git or directory itself, so filters
+            # run while it is still being listed and files are counted on the way
+            self.found_files = 0
+            files = self._count_found(self.get_git_files() if self.use_git else self.get_local_files())
+            
+            # Apply all filters in one pass
+            filtered = extensions or bregex is not None or wregex is not None
+            
+            if filtered:
+                files = self._apply_filters(files, extensions, bregex, wregex)
+            
+            files = list(files)
+            
+            source = "Git repository" if self.use_git else "current directory"
+            print(f"{Fore.LIGHTGREEN_EX}✓ Found {Fore.LIGHTBLUE_EX}{self.found_files} {Fore.LIGHTGREEN_EX}files in {source}{Style.RESET_ALL}")
             
-            # Apply filters
-            if extensions:
-                files = self.filter_files_by_extensions(files, extensions)
+            if filtered:
+                print(f"{Fore.LIGHTYELLOW_EX}✓ After filtering: {Fore.LIGHTCYAN_EX}{len(files)} {Fore.LIGHTYELLOW_EX}files remaining{Style.RESET_ALL}")
             
-            if bregex is not None or wregex is not None:
-                files = self.filter_files_by_regex(files, bregex, wregex)
+            # Sort once by path parts, so converters get files in the same
+            # order as in file tree and can build it without sorting again
+            files.sort(key=lambda file_path: file_path.split('/'))
             
             return files
             
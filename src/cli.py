@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Command line interface definition for To LLM View application.
+
+This module builds the argument parser shared by all entry points, so common
+options are defined in a single place.
+"""
+
+import argparse
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse command line value as integer not less than 1.
+    
+    Args:
+        value: Raw argument value
+        
+    Returns:
+        int: Parsed value
+        
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer or is less than 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    
+    return number
+
+
+def build_base_parser() -> argparse.ArgumentParser:
+    """
+    Build argument parser with options common to all entry points.
+    
+    Entry points add their own options (e.g. converter selection) on top,
+    converters add their specific options through setup_args.
+    
+    Returns:
+        argparse.ArgumentParser: Preconfigured argument parser
+    """
+    
+    parser = argparse.ArgumentParser(
+        description="Codebase converter to unified text document for working with neural networks",
+        epilog='Example: to-llm-view -r -rb "(^\.)|(^tsconfig)" -rw ".*\.component\..*" -o output.txt -mf 4kb',
+        add_help=False,
+    )
+    
+    parser.add_argument(
+        '-h', '--help',
+        action='store_true',
+        help="Show help message"
+    )
+    
+    parser.add_argument(
+        '-o', '--output',
+        default='codebase_export',
+        help='Output filename (default: codebase_export)'
+    )
+    
+    parser.add_argument(
+        '-r', '--root',
+        action='store_true',
+        help='Create output file at the same level as current folder, not inside it'
+    )
+    
+    
+    parser.add_argument(
+        '-w', '--whitelist',
+        help='File extensions to include (comma separated, e.g.: py,js,html). I recommend using --regex-whitelsit instead.'
+    )
+    
+    
+    parser.add_argument(
+        '-rb', '--regex-blacklist',
+        help='Regex for blacklist filename filtering'
+    )
+    
+    parser.add_argument(
+        '-rw', '--regex-whitelist',
+        help='Regex for whitelist filename filtering'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=positive_int,
+        help='Number of threads reading files (default: 4 per CPU core, up to 32)'
+    )
+    
+    parser.add_argument(
+        '--no-git',
+        action='store_true',
+        help='Walk current directory instead of listing files known to Git (.gitignore is not applied)'
+    )
+    
+    return parser
@@ -6,18 +6,23 @@ bulk text file with structured formatting for LLM consumption.
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import sys
 
-from pathlib import Path
-from typing import List, Set, Optional
+from typing import BinaryIO, List, Set, Optional, Tuple
 from datetime import datetime
-from colorama import Fore, Style
 from src.converters._IConverter import IConverter
 
+# Optional fast JSON encoder, stdlib json is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.info import VERSION
-from src.utils import convert_filesize, eprint, filler
+from src.utils import Fore, Progress, Style, common_prefix_length, convert_filesize, decode_text, encode_output, eprint, exclude_output, is_binary_path, prefetch_map, read_text_file, read_workers
 
 
 def help() -> str:
@@ -44,6 +49,44 @@ def file_extention() -> str:
     return "json"
 
 
+def dumps(obj) -> str:
+    """
+    Serialize value to JSON text with stdlib json.
+    
+    Layout matches orjson output (no whitespace, non-ASCII kept as is),
+    so document bytes don't depend on whether orjson is installed.
+    
+    Args:
+        obj: JSON serializable value
+        
+    Returns:
+        str: JSON text
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dump_json(obj) -> bytes:
+    """
+    Serialize value to utf-8 encoded JSON.
+    
+    orjson is used when installed. Stdlib json is used otherwise and for
+    strings orjson rejects (paths with undecodable bytes kept as surrogates).
+    
+    Args:
+        obj: JSON serializable value
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    
+    return encode_output(dumps(obj))
+
+
 class SlimTextConverter(IConverter):
     """
     Codebase to json converter.
@@ -68,13 +111,15 @@ class SlimTextConverter(IConverter):
         """
         
         if output_dir is not None:
-            self.output_file = output_dir + os.sep + output_file
+            self.output_file = os.path.join(output_dir, output_file)
         else:
             self.output_file = output_file
 
         self.processed_files = 0
         self.skipped_files = 0
         self.errors = []
+        
+        self.jobs = args.jobs or read_workers
 
         self.max_filesize = convert_filesize(args.max_filesize) if args.max_filesize else 1024 ** 2
         print(f"{Fore.GREEN}🔍 | max filesize (B) |{Style.RESET_ALL}")
@@ -91,22 +136,37 @@ class SlimTextConverter(IConverter):
             SystemExit: If critical error occurs during file creation
         """
         try:
+            # Output file is opened before files are read, it can't be exported itself
+            files = exclude_output(files, self.output_file)
+            
             # Create file tree
             file_tree = self.create_file_tree(files)
             
-            # Process files
-            files_content = self.process_files(files)
+            # Statistics are not known until all files are processed, so header
+            # is written with fixed width placeholders and rewritten at the end
+            stats_width = len(str(len(files)))
             
             # Build final document
             print(f"💾 | {Fore.LIGHTCYAN_EX}{self.output_file}{Style.RESET_ALL}")
             
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "header": self.create_header(),
-                    "tree": file_tree,
-                    "files": files_content,
-                    "footer": self.create_footer()
-                }, f, indent=None)
+            # Document is written piece by piece with the same layout json.dump
+            # gives, so file contents are never collected into one object
+            with open(self.output_file, 'wb', buffering=1 << 20) as f:
+                # Write header placeholder
+                f.write(encode_output('{"header":' + self.dump_header(stats_width)))
+                
+                # Write file tree
+                f.write(encode_output(',"tree":' + dumps(file_tree) + ',"files":{'))
+                
+                # Stream file contents
+                self.process_files(files, f)
+                
+                # Write footer
+                f.write(encode_output('},"footer":' + dumps(self.create_footer()) + '}'))
+                
+                # Rewrite header with final statistics
+                f.seek(0)
+                f.write(encode_output('{"header":' + self.dump_header(stats_width)))
             
             print(f"{Fore.LIGHTBLUE_EX}✅ | processed | skipped |{Style.RESET_ALL}")
             print(f"   | {Fore.GREEN}{self.processed_files: 9} | {Fore.RED}{self.skipped_files: 7} |{Style.RESET_ALL}")
@@ -120,141 +180,145 @@ class SlimTextConverter(IConverter):
             eprint(f"💥 Critical error: {str(e)}")
             sys.exit(1)
     
-    def create_file_tree(self, files: List[str]) -> dict:
+    def create_file_tree(self, files: List[str]) -> list:
         """
         Create file tree in readable format.
         
         Args:
-            files: List of file paths
+            files: List of file paths, sorted by path parts
             
         Returns:
-            String representation of file tree
+            File tree, list of file names and {"dir", "files"} directory entries
         """
         print("📁 | file tree gen...")
 
-        # Sort files for nice display
-        sorted_files = sorted(files)
-
-        # Group files by directories
-        dirs = {}
-        for file_path in sorted_files:
-            path_parts = Path(file_path).parts
+        tree = []
+        
+        # Files come sorted by path parts, so tree is built in one pass.
+        # Stack holds files lists of root and of every directory of previous path
+        stack = [tree]
+        prev_dirs = []
+        
+        for file_path in files:
+            # Git always separates path parts with '/'
+            path_parts = file_path.split('/')
+            dirs = path_parts[:-1]
             
-            # Process each nesting level
-            current_dict = dirs
-            for part in path_parts[:-1]:  # All parts except filename
-                if part not in current_dict:
-                    current_dict[part] = {}
-                current_dict = current_dict[part]
+            # Leave directories not shared with previous path, then open new ones
+            common = common_prefix_length(dirs, prev_dirs)
+            del stack[common + 1:]
+            
+            for name in dirs[common:]:
+                subtree = []
+                stack[-1].append({
+                    "dir": name,
+                    "files": subtree,
+                })
+                stack.append(subtree)
             
             # Add file
-            filename = path_parts[-1]
-            current_dict[filename] = None
+            stack[-1].append(path_parts[-1])
+            prev_dirs = dirs
         
-        # Build tree recursively
-        def build_tree(d: dict) -> list:
-            lines = []
-            items = sorted(d.items())
-            
-            for i, (name, subdirs) in enumerate(items):
-                if subdirs is not None: 
-                    lines.append({ 
-                        "dir": name,
-                        "files": build_tree(subdirs),
-                    })
-                else:
-                    lines.append(name)
-                    
-            return lines
-
-        return build_tree(dirs)
+        return tree
 
-    def read_file_safely(self, file_path: str) -> Optional[str]:
+    def read_file_safely(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Safely read file with error handling.
         
+        Runs in reader threads, so converter state is not touched here,
+        errors are returned to the caller instead.
+        
         Args:
             file_path: File path
             
         Returns:
-            File content or None in case of error
+            Tuple of file content (None in case of error) and error description (None if there is none)
         """
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                self.errors.append(f"File doesn't exist: {file_path}")
-                return None
+            # Known binary files are only checked to exist, their content is never read
+            if is_binary_path(file_path):
+                os.stat(file_path)
+                
+                return "[UNSUPPORTED ENCODING]", f"Binary file: {file_path}"
             
-            # Try to read as text file with different encodings
-            encodings = ['utf-8', 'cp1251', 'latin1', 'ascii']
+            raw, filesize = read_text_file(file_path, self.max_filesize)
             
-            for encoding in encodings:
-                try:
-                    # Check if file is not too large (> 1MB)
-                    filesize = os.path.getsize(file_path)
-                    
-                    if filesize > self.max_filesize:
-                        self.errors.append(f"File too large (>{self.max_filesize} Bytes): {file_path}")
-                        return f"[TOO LARGE {filesize} B, SKIP]"
-                    
-                    with open(file_path, 'r', encoding=encoding, errors='strict') as f:
-                        content = f.read()
-                    
-                    return content
-                    
-                except UnicodeDecodeError:
-                    continue
-                except UnicodeError:
-                    continue
+            if raw is None:
+                return f"[TOO LARGE {filesize} B, SKIP]", f"File too large (>{self.max_filesize} Bytes): {file_path}"
+            
+            content = decode_text(raw)
+            
+            if content is not None:
+                return content, None
+            
+            # If couldn't decode with any encoding - probably binary file
+            return "[UNSUPPORTED ENCODING]", f"Binary file or unsupported encoding: {file_path}"
             
-            # If couldn't read with any encoding - probably binary file
-            self.errors.append(f"Binary file or unsupported encoding: {file_path}")
-            return "[UNSUPPORTED ENCODING]"
+        except FileNotFoundError:
+            return None, f"File doesn't exist: {file_path}"
             
         except PermissionError:
-            self.errors.append(f"No access rights to file: {file_path}")
-            return "[NO ACCESS]"
+            return "[NO ACCESS]", f"No access rights to file: {file_path}"
             
         except Exception as e:
-            self.errors.append(f"Unexpected error reading {file_path}: {str(e)}")
-            return f"[READING ERROR: {str(e)}]"
+            return f"[READING ERROR: {str(e)}]", f"Unexpected error reading {file_path}: {str(e)}"
 
-    def process_files(self, files: List[str]) -> dict:
+    def process_files(self, files: List[str], out: BinaryIO) -> None:
         """
-        Process file list and create unified text document.
+        Process file list and stream "files" object members to output.
+        
+        Each file entry is written right after the file is read, so only
+        a single file content is held in memory at a time.
         
         Args:
             files: List of file paths
-            
-        Returns:
-            Content of all files in unified format
+            out: Output binary stream
         """
         print(f"   | {Fore.LIGHTBLUE_EX}files{Style.RESET_ALL} |")
         print(f"   | {Fore.LIGHTGREEN_EX}{len(files): 5}{Style.RESET_ALL} |")
         
-        output = {}
+        members_separator = b""
         files_amount = len(files)
+        amount_width = len(str(files_amount))
         
-        for i, file_path in enumerate(files, 1):
-            print(f"{Fore.LIGHTGREEN_EX}📄 | {filler(str(i), len(str(files_amount)), ' ')}/{files_amount} | {Fore.LIGHTBLUE_EX}{file_path}{Style.RESET_ALL}")
-            
-            # Read file content
-            file_content = self.read_file_safely(file_path)
+        # Progress is written only on a terminal and at most every 50 ms
+        progress = Progress(files_amount)
+        
+        # Colors used in progress line are looked up once
+        green, blue, reset = Fore.LIGHTGREEN_EX, Fore.LIGHTBLUE_EX, Style.RESET_ALL
+        
+        # Files are read in worker threads a few files ahead of writing, results
+        # keep input order and only the read ahead window is held in memory
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = prefetch_map(executor, self.read_file_safely, files, self.jobs * 2)
             
-            if file_content is None:
-                self.skipped_files += 1
+            for i, (file_path, (file_content, error)) in enumerate(zip(files, results), 1):
+                if progress.due(i):
+                    progress.write(f"{green}📄 | {i:>{amount_width}}/{files_amount} | {blue}{file_path}{reset}")
+                
+                # Statistics are only updated here, on the main thread
+                if error is not None:
+                    self.errors.append(error)
                 
-                continue
+                if file_content is None:
+                    self.skipped_files += 1
+                    
+                    continue
 
-            output[file_path] = {
-                "path": file_path,
-                "len": len(file_content),
-                "content": file_content,
-            }
+                file_entry = {
+                    "path": file_path,
+                    "len": len(file_content),
+                    "content": file_content,
+                }
+                
+                out.write(members_separator)
+                out.write(dump_json(file_path))
+                out.write(b":")
+                out.write(dump_json(file_entry))
+                members_separator = b","
 
-            self.processed_files += 1
-        
-        return output
+                self.processed_files += 1
 
     def create_header(self) -> dict:
         """
@@ -277,6 +341,27 @@ class SlimTextConverter(IConverter):
             }
         }
 
+    def dump_header(self, stats_width: int = 0) -> str:
+        """
+        Serialize document header with fixed width statistics.
+        
+        Numbers are padded with trailing spaces (valid JSON whitespace),
+        so header length stays stable when it is rewritten in place.
+        
+        Args:
+            stats_width: Minimal width of statistics numbers
+            
+        Returns:
+            Document header as JSON
+        """
+        header = self.create_header()
+        info = header.pop("info")
+        
+        info_json = ",".join(f"{dumps(key)}:{value:<{stats_width}}" for key, value in info.items())
+        
+        # Header object is not empty, so its closing brace is replaced with info member
+        return dumps(header)[:-1] + f',"info":{{{info_json}}}}}'
+
     def create_footer(self) -> dict:
         """
         Create document footer with error information.
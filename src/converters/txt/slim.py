@@ -6,17 +6,20 @@ bulk text file with structured formatting for LLM consumption.
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
 
-from pathlib import Path
-from typing import List, Set, Optional
+from typing import BinaryIO, List, Set, Optional, Tuple
 from datetime import datetime
-from colorama import Fore, Style
 from src.converters._IConverter import IConverter
 
 from src.info import VERSION
-from src.utils import convert_filesize, eprint, filler
+from src.utils import Fore, Progress, Style, common_prefix_length, convert_filesize, decode_text, encode_output, eprint, exclude_output, is_binary_path, prefetch_map, read_text_file, read_workers
+
+
+# Document sections separator
+SECTION_SEPARATOR = "---"
 
 
 def help() -> str:
@@ -62,13 +65,15 @@ class SlimTextConverter(IConverter):
 		"""
 		
 		if output_dir is not None:
-			self.output_file = output_dir + os.sep + output_file
+			self.output_file = os.path.join(output_dir, output_file)
 		else:
 			self.output_file = output_file
 
 		self.processed_files = 0
 		self.skipped_files = 0
 		self.errors = []
+		
+		self.jobs = args.jobs or read_workers
 
 		self.max_filesize = convert_filesize(args.max_filesize) if args.max_filesize else 1024 ** 2
 		print(f"{Fore.GREEN}🔍 | max filesize (B) |{Style.RESET_ALL}")
@@ -85,27 +90,36 @@ class SlimTextConverter(IConverter):
 			SystemExit: If critical error occurs during file creation
 		"""
 		try:
+			# Output file is opened before files are read, it can't be exported itself
+			files = exclude_output(files, self.output_file)
+			
 			# Create file tree
 			file_tree = self.create_file_tree(files)
 			
-			# Process files
-			files_content = self.process_files(files)
+			# Statistics are not known until all files are processed, so header
+			# is written with fixed width placeholders and rewritten at the end
+			stats_width = len(str(len(files)))
 			
 			# Build final document
 			print(f"💾 | {Fore.LIGHTCYAN_EX}{self.output_file}{Style.RESET_ALL}")
 			
-			with open(self.output_file, 'w', encoding='utf-8') as f:
-				# Write header (after processing to include statistics)
-				f.write(self.create_header())
-				
-				# Write file tree
-				f.write(file_tree)
+			# Binary mode with large buffer, every block is encoded once before writing
+			with open(self.output_file, 'wb', buffering=1 << 20) as f:
+				# Write header placeholder and file tree in one call
+				f.writelines((
+					encode_output(self.create_header(stats_width)),
+					encode_output(file_tree),
+				))
 				
-				# Write file contents
-				f.write(files_content)
+				# Stream file contents
+				self.process_files(files, f)
 				
 				# Write footer
-				f.write(self.create_footer())
+				f.write(encode_output(self.create_footer()))
+				
+				# Rewrite header with final statistics
+				f.seek(0)
+				f.write(encode_output(self.create_header(stats_width)))
 			
 			print(f"{Fore.LIGHTBLUE_EX}✅ | processed | skipped |{Style.RESET_ALL}")
 			print(f"   | {Fore.GREEN}{self.processed_files: 9} | {Fore.RED}{self.skipped_files: 7} |{Style.RESET_ALL}")
@@ -124,7 +138,7 @@ class SlimTextConverter(IConverter):
 		Create file tree in readable format.
 		
 		Args:
-			files: List of file paths
+			files: List of file paths, sorted by path parts
 			
 		Returns:
 			String representation of file tree
@@ -133,143 +147,133 @@ class SlimTextConverter(IConverter):
 
 		tree_lines = ["STRUCTURE:", ""]
 
-		# Sort files for nice display
-		sorted_files = sorted(files)
-
-		# Group files by directories
-		dirs = {}
-		for file_path in sorted_files:
-			path_parts = Path(file_path).parts
-			
-			# Process each nesting level
-			current_dict = dirs
-			for part in path_parts[:-1]:  # All parts except filename
-				if part not in current_dict:
-					current_dict[part] = {}
-				current_dict = current_dict[part]
-			
-			# Add file
-			filename = path_parts[-1]
-			current_dict[filename] = None
+		# Files come sorted by path parts, so directories of a path that are
+		# shared with the previous path are already listed
+		prev_parts = []
 		
-		# Build tree recursively
-		def build_tree(d: dict, prefix: str = "") -> List[str]:
-			lines = []
-			items = sorted(d.items())
+		for file_path in files:
+			# Git always separates path parts with '/'
+			path_parts = file_path.split('/')
 			
-			for name, subdirs in items:
-				if subdirs is not None: 
-					lines.append(f"{prefix}-| {name}/")
-					lines.extend(build_tree(subdirs, prefix + "-"))
-				else:
-					lines.append(f"{prefix}-| {name}")
-					
-			return lines
+			# List new directories, then the file itself
+			for depth in range(common_prefix_length(path_parts, prev_parts), len(path_parts) - 1):
+				tree_lines.append(f"{'-' * depth}-| {path_parts[depth]}/")
+			
+			tree_lines.append(f"{'-' * (len(path_parts) - 1)}-| {path_parts[-1]}")
+			prev_parts = path_parts
 		
-		tree_lines.extend(build_tree(dirs))
-
-		tree_lines.extend(["", "---", "", ""])
+		tree_lines.extend(["", SECTION_SEPARATOR, "", ""])
 		return "\n".join(tree_lines)
 
-	def read_file_safely(self, file_path: str) -> Optional[str]:
+	def read_file_safely(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
 		"""
 		Safely read file with error handling.
 		
+		Runs in reader threads, so converter state is not touched here,
+		errors are returned to the caller instead.
+		
 		Args:
 			file_path: File path
 			
 		Returns:
-			File content or None in case of error
+			Tuple of file content (None in case of error) and error description (None if there is none)
 		"""
 		try:
-			# Check if file exists
-			if not os.path.exists(file_path):
-				self.errors.append(f"File doesn't exist: {file_path}")
-				return None
+			# Known binary files are only checked to exist, their content is never read
+			if is_binary_path(file_path):
+				os.stat(file_path)
+				
+				return "[UNSUPPORTED ENCODING]", f"Binary file: {file_path}"
 			
-			# Try to read as text file with different encodings
-			encodings = ['utf-8', 'cp1251', 'latin1', 'ascii']
+			raw, filesize = read_text_file(file_path, self.max_filesize)
 			
-			for encoding in encodings:
-				try:
-					# Check if file is not too large (> 1MB)
-					filesize = os.path.getsize(file_path)
-					
-					if filesize > self.max_filesize:
-						self.errors.append(f"File too large (>{self.max_filesize} Bytes): {file_path}")
-						return f"[TOO LARGE {filesize} B, SKIP]"
-					
-					with open(file_path, 'r', encoding=encoding, errors='strict') as f:
-						content = f.read()
-					
-					return content
-					
-				except UnicodeDecodeError:
-					continue
-				except UnicodeError:
-					continue
+			if raw is None:
+				return f"[TOO LARGE {filesize} B, SKIP]", f"File too large (>{self.max_filesize} Bytes): {file_path}"
 			
-			# If couldn't read with any encoding - probably binary file
-			self.errors.append(f"Binary file or unsupported encoding: {file_path}")
-			return "[UNSUPPORTED ENCODING]"
+			content = decode_text(raw)
+			
+			if content is not None:
+				return content, None
+			
+			# If couldn't decode with any encoding - probably binary file
+			return "[UNSUPPORTED ENCODING]", f"Binary file or unsupported encoding: {file_path}"
+			
+		except FileNotFoundError:
+			return None, f"File doesn't exist: {file_path}"
 			
 		except PermissionError:
-			self.errors.append(f"No access rights to file: {file_path}")
-			return "[NO ACCESS]"
+			return "[NO ACCESS]", f"No access rights to file: {file_path}"
 			
 		except Exception as e:
-			self.errors.append(f"Unexpected error reading {file_path}: {str(e)}")
-			return f"[READING ERROR: {str(e)}]"
+			return f"[READING ERROR: {str(e)}]", f"Unexpected error reading {file_path}: {str(e)}"
 
-	def process_files(self, files: List[str]) -> str:
+	def process_files(self, files: List[str], out: BinaryIO) -> None:
 		"""
-		Process file list and create unified text document.
+		Process file list and stream unified text document to output.
+		
+		Each file block is written right after the file is read, so only
+		a single file content is held in memory at a time.
 		
 		Args:
 			files: List of file paths
-			
-		Returns:
-			Content of all files in unified format
+			out: Output binary stream
 		"""
 		print(f"   | {Fore.LIGHTBLUE_EX}files{Style.RESET_ALL} |")
 		print(f"   | {Fore.LIGHTGREEN_EX}{len(files): 5}{Style.RESET_ALL} |")
 		
-		content_parts = []
-		separator = "---"
+		blocks_separator = b""
+		
+		# File info block, only path, size and content vary per file
+		block_template = (
+			f"{SECTION_SEPARATOR}\n"
+			"PATH | LENGTH\n"
+			"{path} | {size}\n"
+			"content:\n"
+			"```\n"
+			"{content}\n"
+			"```\n"
+		)
 		files_amount = len(files)
+		amount_width = len(str(files_amount))
 		
-		for i, file_path in enumerate(files, 1):
-			print(f"{Fore.LIGHTGREEN_EX}📄 | {filler(str(i), len(str(files_amount)), ' ')}/{files_amount} | {Fore.LIGHTBLUE_EX}{file_path}{Style.RESET_ALL}")
-			
-			# Read file content
-			file_content = self.read_file_safely(file_path)
+		# Progress is written only on a terminal and at most every 50 ms
+		progress = Progress(files_amount)
+		
+		# Colors used in progress line are looked up once
+		green, blue, reset = Fore.LIGHTGREEN_EX, Fore.LIGHTBLUE_EX, Style.RESET_ALL
+		
+		# Files are read in worker threads a few files ahead of writing, results
+		# keep input order and only the read ahead window is held in memory
+		with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+			results = prefetch_map(executor, self.read_file_safely, files, self.jobs * 2)
 			
-			if file_content is None:
-				self.skipped_files += 1
+			for i, (file_path, (file_content, error)) in enumerate(zip(files, results), 1):
+				if progress.due(i):
+					progress.write(f"{green}📄 | {i:>{amount_width}}/{files_amount} | {blue}{file_path}{reset}")
 				
-				continue
-			
-			# Create file info block
-			file_block = [
-				separator,
-				"PATH | LENGTH",
-				f"{file_path} | {len(file_content)}",
-				"content:",
-				"```",
-				file_content,
-				"```",
-				""
-			]
-			
-			content_parts.extend(file_block)
-			self.processed_files += 1
-		
-		return "\n".join(content_parts)
+				# Statistics are only updated here, on the main thread
+				if error is not None:
+					self.errors.append(error)
+				
+				if file_content is None:
+					self.skipped_files += 1
+					
+					continue
+				
+				out.write(blocks_separator)
+				out.write(encode_output(block_template.format(path=file_path, size=len(file_content), content=file_content)))
+				blocks_separator = b"\n"
+				
+				self.processed_files += 1
 
-	def create_header(self) -> str:
+	def create_header(self, stats_width: int = 0) -> str:
 		"""
 		Create document header with meta information.
 		
+		Args:
+			stats_width: Minimal width of statistics numbers, keeps header
+				length stable when it is rewritten in place
+		
 		Returns:
 			Document header
 		"""
@@ -282,9 +286,9 @@ dir | date
 {current_dir} | {timestamp}
 
 processed | skipped | errors
-{self.processed_files} | {self.skipped_files} | {len(self.errors)}
+{self.processed_files:<{stats_width}} | {self.skipped_files:<{stats_width}} | {len(self.errors):<{stats_width}}
 
----
+{SECTION_SEPARATOR}
 """
 		return header
 
@@ -296,14 +300,14 @@ processed | skipped | errors
 			Document footer
 		"""
 		footer_parts = [
-			"---",
+			SECTION_SEPARATOR,
 			"DONE",
 		]
 		
 		if self.errors:
 			footer_parts.extend([
 				"ERRORS:",
-				"---",
+				SECTION_SEPARATOR,
 				""
 			])
 			
@@ -10,16 +10,30 @@ and coordinates the codebase conversion process.
 
 import importlib
 import os
-import argparse
 from pathlib import Path
-import re
 import sys
 
-from colorama import Fore, Back, Style
 
 import src.converters._IConverter as IConverter
+from src.cli import build_base_parser
 from src.CodebaseConverter import CodebaseFileGetter
-from src.utils import convert_filesize, eprint, get_all_process_types, parse_extensions
+from src.utils import Back, Fore, Style, compile_regex, convert_filesize, eprint, get_all_process_types, parse_extensions
+
+
+def load_converter(converter_type: str):
+    """
+    Import converter module by its type name.
+    
+    Converters are imported only on demand, so unrelated converters never load.
+    
+    Args:
+        converter_type: Converter type name (e.g., "txt.bulk")
+        
+    Returns:
+        module: Converter module implementing the IConverter module interface
+    """
+    return importlib.import_module("src.converters." + converter_type)
+
 
 def main():
     """
@@ -32,71 +46,44 @@ def main():
         int: Exit code (0 for success, 1 for error)
     """
     
-    parser = argparse.ArgumentParser(
-        description="Codebase converter to unified text document for working with neural networks",
-        epilog='Example: to-llm-view -r -rb "(^\.)|(^tsconfig)" -rw ".*\.component\..*" -o output.txt -mf 4kb',
-        add_help=False,
-    )
-    
-    parser.add_argument(
-        '-h', '--help',
-        action='store_true',
-        help="Show help message"
-    )
-    
-    parser.add_argument(
-        '-o', '--output',
-        default='codebase_export',
-        help='Output filename (default: codebase_export)'
-    )
-    
-    parser.add_argument(
-        '-r', '--root',
-        action='store_true',
-        help='Create output file at the same level as current folder, not inside it'
-    )
-    
-    
-    parser.add_argument(
-        '-w', '--whitelist',
-        help='File extensions to include (comma separated, e.g.: py,js,html). I recommend using --regex-whitelsit instead.'
-    )
-    
-    
-    parser.add_argument(
-        '-rb', '--regex-blacklist',
-        help='Regex for blacklist filename filtering'
-    )
-    
-    parser.add_argument(
-        '-rw', '--regex-whitelist',
-        help='Regex for whitelist filename filtering'
-    )
+    parser = build_base_parser()
     
     converters_types = get_all_process_types(os.path.join(Path(__file__).parent, "converters"))
+    default_converter = "txt.bulk" if "txt.bulk" in converters_types else converters_types[0]
     
     parser.add_argument(
         '-c', '--converter',
-        default="txt.bulk" if "txt.bulk" in converters_types else converters_types[0],
-        help=f"Converter to use. Currently available: {', '.join(converters_types)}"
+        help=f"Converter to use (default: {default_converter}). Currently available: {', '.join(converters_types)}. "
+             f"Combine with -h to see converter specific options"
     )
     
     pre_args = parser.parse_known_args()[0]
+    converter_type = pre_args.converter or default_converter
     
-    if not pre_args.help and pre_args.converter not in converters_types:
+    if converter_type not in converters_types:
+        if pre_args.help:
+            parser.print_help()
+            
+            return 0
+        
         print("Invalid process_type!")
         print("Available process types:")
         
-        for converter_type in converters_types:
-            module = importlib.import_module("src.converters." + converter_type)
-            print(f" - {converter_type}")
+        for available_type in converters_types:
+            module = load_converter(available_type)
+            print(f" - {available_type}")
             print(f"    {module.help()}")
         
         return 1
+    
+    # Help doesn't need the converter unless it was explicitly requested
+    if pre_args.help and pre_args.converter is None:
+        parser.print_help()
         
-    if pre_args.converter in converters_types:
-        converter: IConverter = importlib.import_module("src.converters." + pre_args.converter)
-        converter.setup_args(parser)
+        return 0
+    
+    converter: IConverter = load_converter(converter_type)
+    converter.setup_args(parser)
     
     args = parser.parse_args()
     
@@ -112,20 +99,21 @@ def main():
         print(f"🔍 {Fore.GREEN}Filtering by extensions: {Fore.LIGHTMAGENTA_EX}{', '.join(sorted(extensions))}{Style.RESET_ALL}")
     
     
-    bregex = re.compile(args.regex_blacklist, re.IGNORECASE) if args.regex_blacklist else None
+    bregex = compile_regex(args.regex_blacklist) if args.regex_blacklist else None
     
     if bregex:
         print(f"🔍 {Fore.GREEN}Filtering by blacklist Regex: {Fore.LIGHTCYAN_EX}{args.regex_blacklist}{Style.RESET_ALL}")
         
     
-    wregex = re.compile(args.regex_whitelist, re.IGNORECASE) if args.regex_whitelist else None
+    wregex = compile_regex(args.regex_whitelist) if args.regex_whitelist else None
     
     if wregex:
         print(f"🔍 {Fore.GREEN}Filtering by whitelist Regex: {Fore.LIGHTCYAN_EX}{args.regex_whitelist}{Style.RESET_ALL}")
     
     
     # Check if we're in a Git repository
-    if not os.path.exists('.git'):
+    # lstat only, '.git' may also be a file (worktrees, submodules)
+    if not args.no_git and not os.path.lexists('.git'):
         eprint("❌ Error: current directory is not a Git repository")
         eprint("   Navigate to Git repository root and run the program again")
         return 1
@@ -134,12 +122,12 @@ def main():
     root_path = None
     if args.root:
         p = os.getcwd()
-        root_path = p[:p.rfind(os.sep)]
+        root_path = os.path.dirname(p)
         
-        output_name = p[p.rfind(os.sep)+len(os.sep):]+"."+output_name
+        output_name = os.path.basename(p)+"."+output_name
     
     # Create and run converter
-    getter = CodebaseFileGetter()
+    getter = CodebaseFileGetter(use_git=not args.no_git)
     files = getter.convert(extensions, bregex, wregex)
     
     
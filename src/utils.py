@@ -7,12 +7,36 @@ This module provides various helper functions used throughout the application
 for file processing, string manipulation, and system operations.
 """
 
-from os import listdir
+import codecs
+from collections import deque
+from concurrent.futures import Executor
+from functools import lru_cache
 import os
 import re
-from typing import Any, List, Optional, Set
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from colorama import Back, Fore, Style
+
+class NoColor:
+	"""
+	Stand-in for colorama Fore/Back/Style when output is not a terminal.
+	
+	Every color code resolves to an empty string.
+	"""
+	
+	def __getattr__(self, name: str) -> str:
+		return ""
+
+
+# Is output shown on a terminal (not CI log, pipe or file)
+stdout_tty = sys.stdout is not None and sys.stdout.isatty()
+
+# Colors only make sense on a terminal, on CI or pipes colorama is not even imported
+if stdout_tty:
+	from colorama import Back, Fore, Style
+else:
+	Fore = Back = Style = NoColor()
 
 
 def parse_extensions(ext_string: str) -> Set[str]:
@@ -39,6 +63,24 @@ def parse_extensions(ext_string: str) -> Set[str]:
 	return extensions
 
 
+@lru_cache(maxsize=128)
+def compile_regex(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+	"""
+	Compile regex pattern, reusing previously compiled patterns.
+	
+	Cache is keyed by pattern string and flags, so repeated runs inside one
+	process (e.g. when embedded in scripts) skip recompilation.
+	
+	Args:
+		pattern: Regex pattern string
+		flags: Regex flags (default: re.IGNORECASE)
+		
+	Returns:
+		re.Pattern: Compiled pattern
+	"""
+	return re.compile(pattern, flags)
+
+
 def eprint(content: Any, **kwargs) -> None:
 	"""
 	Print error message with colored background.
@@ -62,18 +104,320 @@ def filler(cur: str, max_len: int, fill: Optional[str] = " ") -> str:
 	Returns:
 		str: Padded string with specified length
 	"""
-	if len(cur) >= max_len: 
-		return cur
-	
-	if fill is None or len(fill) == 0:
+	if not fill:
 		fill = " "
 	
-	filler_length = max_len - len(cur)
+	# Single character fill is padded in C
+	if len(fill) == 1:
+		return cur.rjust(max_len, fill)
+	
+	cur_length = len(cur)
+	
+	if cur_length >= max_len: 
+		return cur
+	
+	filler_length = max_len - cur_length
 	filler_string = (fill * filler_length)[:filler_length]
 	
 	return filler_string + cur
 
 
+def common_prefix_length(a: List[str], b: List[str]) -> int:
+	"""
+	Count leading items equal in both lists.
+	
+	Args:
+		a: First list (e.g. path parts)
+		b: Second list
+		
+	Returns:
+		int: Length of common prefix
+	"""
+	length = min(len(a), len(b))
+	
+	for i in range(length):
+		if a[i] != b[i]:
+			return i
+	
+	return length
+
+
+
+def exclude_output(files: List[str], output_file: str) -> List[str]:
+	"""
+	Remove output file from file list.
+	
+	Output file is truncated before listed files are read, so when it is
+	listed itself (untracked export, --no-git) it must not be exported.
+	
+	Args:
+		files: List of file paths relative to current directory, separated with '/'
+		output_file: Output file path
+		
+	Returns:
+		List[str]: File list without output file
+	"""
+	output_path = os.path.relpath(output_file).replace(os.sep, '/')
+	
+	# Output outside current directory is never listed
+	if output_path.startswith('../'):
+		return files
+	
+	return [file_path for file_path in files if file_path != output_path]
+
+# Worker threads used to read files, reading is I/O bound so it exceeds CPU count
+read_workers = min(32, (os.cpu_count() or 1) * 4)
+
+
+class Progress:
+	"""
+	Throttled per-item progress output.
+	
+	Lines are written at most once per interval and always for the last item.
+	Nothing is written when stdout is not a terminal, so logs stay clean.
+	"""
+	
+	def __init__(self, total: int, interval: float = 0.05):
+		"""
+		Initialize progress output.
+		
+		Args:
+			total: Number of items
+			interval: Minimal time between written lines (seconds)
+		"""
+		self.total = total
+		self.interval = interval
+		self.enabled = stdout_tty
+		self.last_time = 0.0
+	
+	def due(self, i: int) -> bool:
+		"""
+		Check whether progress line for item should be written.
+		
+		Args:
+			i: Item number, starting from 1
+			
+		Returns:
+			bool: True if line should be written now
+		"""
+		if not self.enabled:
+			return False
+		
+		if i == self.total:
+			return True
+		
+		now = time.monotonic()
+		
+		if now - self.last_time < self.interval:
+			return False
+		
+		self.last_time = now
+		return True
+	
+	def write(self, line: str) -> None:
+		"""
+		Write progress line directly to stdout.
+		
+		Args:
+			line: Progress line without newline
+		"""
+		sys.stdout.write(line + "\n")
+		sys.stdout.flush()
+
+
+def prefetch_map(executor: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+	"""
+	Map function over items in executor, keeping at most window calls ahead.
+	
+	Unlike Executor.map, items are submitted lazily as results are consumed,
+	so memory held by results read ahead of the consumer stays bounded.
+	
+	Args:
+		executor: Executor running the calls
+		fn: Function to call for every item
+		items: Items to map over
+		window: Maximum number of calls submitted but not yet consumed
+		
+	Yields:
+		Any: Results in input order
+	"""
+	pending = deque()
+	
+	for item in items:
+		if len(pending) >= window:
+			yield pending.popleft().result()
+		
+		pending.append(executor.submit(fn, item))
+	
+	while pending:
+		yield pending.popleft().result()
+
+
+# Extensions of files that are never text, such files are not even read.
+# Extensions also used by text formats (e.g. Wavefront '.obj', KiCad '.lib',
+# generic '.bin') are left to the NUL bytes check of is_binary_content
+binary_extensions = frozenset({
+	# Images
+	'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.tif', '.tiff', '.psd',
+	# Archives
+	'.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.jar', '.iso', '.dmg',
+	# Compiled code
+	'.o', '.a', '.so', '.dylib', '.dll', '.exe', '.class', '.pyc', '.pyo', '.pyd', '.wasm',
+	# Databases
+	'.sqlite', '.sqlite3',
+	# Documents
+	'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+	# Fonts
+	'.woff', '.woff2', '.ttf', '.otf', '.eot',
+	# Media
+	'.mp3', '.mp4', '.wav', '.ogg', '.flac', '.avi', '.mov', '.mkv', '.webm',
+})
+
+
+def is_binary_path(file_path: str) -> bool:
+	"""
+	Check whether file is binary judging by its extension only.
+	
+	Args:
+		file_path: File path separated with '/'
+		
+	Returns:
+		bool: True if file extension is a known binary one
+	"""
+	dot = file_path.rfind('.')
+	
+	return dot > file_path.rfind('/') and file_path[dot:].lower() in binary_extensions
+
+
+# Encodings tried in order when decoding file content, utf-8 is the common
+# case and latin1 maps every byte, so it is the terminal fallback
+text_encodings = ['utf-8', 'cp1251', 'latin1']
+
+# Decoders are looked up once, so codec registry is not queried for every file
+text_decoders = [codecs.lookup(encoding).decode for encoding in text_encodings]
+
+# Byte order marks naming file encoding directly, utf-32 goes first
+# as its little endian BOM starts with the utf-16 one
+text_boms = [
+	(codecs.BOM_UTF32_LE, codecs.lookup('utf-32').decode),
+	(codecs.BOM_UTF32_BE, codecs.lookup('utf-32').decode),
+	(codecs.BOM_UTF8, codecs.lookup('utf-8-sig').decode),
+	(codecs.BOM_UTF16_LE, codecs.lookup('utf-16').decode),
+	(codecs.BOM_UTF16_BE, codecs.lookup('utf-16').decode),
+]
+
+# Head of file checked for NUL bytes, the same heuristic git and file(1) use
+binary_sniff_size = 8192
+
+
+def is_binary_content(head: bytes) -> bool:
+	"""
+	Check whether file content is binary judging by its head.
+	
+	Text has no NUL bytes, except utf-16/utf-32 text which starts with a BOM.
+	
+	Args:
+		head: File content, only first binary_sniff_size bytes are checked
+		
+	Returns:
+		bool: True if content is binary
+	"""
+	return b'\0' in head[:binary_sniff_size] and not any(head.startswith(bom) for bom, _ in text_boms)
+
+
+def decode_text(raw: bytes) -> Optional[str]:
+	"""
+	Decode raw file content trying known text encodings in order.
+	
+	If content starts with a BOM, its encoding is tried first and the BOM
+	is stripped. Binary content (see is_binary_content) is not decoded at all.
+	Newlines are normalized the same way as text mode reading does.
+	
+	Args:
+		raw: Raw file content
+		
+	Returns:
+		Optional[str]: Decoded text or None if no encoding fits
+	"""
+	decoders = text_decoders
+	
+	for bom, decoder in text_boms:
+		if raw.startswith(bom):
+			decoders = [decoder] + text_decoders
+			break
+	else:
+		# Without BOM, NUL bytes mean binary file, every decoder would be wasted on it
+		if b'\0' in raw[:binary_sniff_size]:
+			return None
+	
+	for decode in decoders:
+		try:
+			content = decode(raw)[0]
+		except UnicodeError:
+			continue
+		
+		# Match universal newlines of text mode reading
+		if '\r' in content:
+			content = content.replace('\r\n', '\n').replace('\r', '\n')
+		
+		return content
+	
+	return None
+
+
+def read_text_file(file_path: str, max_size: int) -> Tuple[Optional[bytes], int]:
+	"""
+	Read raw file content for decode_text, bounded by size limit.
+	
+	File is opened once, its size is taken from the opened descriptor. Binary
+	files (see is_binary_content) are recognized by their head, the rest of
+	them is never read, so only the head is returned and decode_text rejects it.
+	
+	Args:
+		file_path: File path
+		max_size: Maximum file size in bytes
+		
+	Returns:
+		Tuple[Optional[bytes], int]: Raw content (None if file is larger than
+			max_size) and file size in bytes
+		
+	Raises:
+		OSError: If file can't be opened or read
+	"""
+	with open(file_path, 'rb') as f:
+		filesize = os.fstat(f.fileno()).st_size
+		
+		if filesize > max_size:
+			return None, filesize
+		
+		raw = f.read(min(binary_sniff_size, max_size + 1))
+		
+		if len(raw) == binary_sniff_size and not is_binary_content(raw):
+			# Read the rest once, never more than the limit as file may grow after stat
+			raw += f.read(max_size + 1 - len(raw))
+	
+	if len(raw) > max_size:
+		return None, len(raw)
+	
+	return raw, max(filesize, len(raw))
+
+
+def encode_output(text: str) -> bytes:
+	"""
+	Encode text for writing into binary output file.
+	
+	Paths that are not valid utf-8 are decoded with surrogateescape,
+	so they are written back as their original bytes.
+	
+	Args:
+		text: Text to encode
+		
+	Returns:
+		bytes: utf-8 encoded text
+	"""
+	return text.encode('utf-8', 'surrogateescape')
+
+
 # Filesize unit correlations in bytes
 filesize_correlations = {
 	'b': 1,
@@ -83,6 +427,10 @@ filesize_correlations = {
 	'tb': 1024 ** 4
 }
 
+# Number with optional unit, both are taken from a single match.
+# Surrounding whitespace and unit case are handled by the pattern itself
+filesize_regex = re.compile(r'^\s*(?P<number>[+-]?(?:[0-9]+(?:[.][0-9]*)?|[.][0-9]+))\s*(?P<unit>b|kb|mb|gb|tb)?\s*$', re.IGNORECASE)
+
 
 def convert_filesize(inp: str) -> int:
 	"""
@@ -104,28 +452,57 @@ def convert_filesize(inp: str) -> int:
 		>>> convert_filesize("500")
 		500
 	"""
-	inp = inp.strip().lower()
+	match = filesize_regex.match(inp)
 
-	# if inp is a plain number
-	if re.match(r'^[+-]?([0-9]+([.][0-9]*)?|[.][0-9]+)$', inp):
-		return int(inp)
+	if match is None:
+		return filesize_correlations['mb']
 
-	if re.match(r'^[+-]?([0-9]+([.][0-9]*)?|[.][0-9]+)(b|kb|mb|gb|tb)$', inp):
-		filesize = re.search(r'(b|kb|mb|gb|tb)$', inp)
-		number = re.search(r'^[+-]?([0-9]+([.][0-9]*)?|[.][0-9]+)', inp)
+	# Plain number is in bytes
+	unit = (match.group('unit') or 'b').lower()
 
-		if filesize is None or number is None:
-			return filesize_correlations['mb']
-		
-		return round(float(number[0]) * filesize_correlations[filesize[0]])
+	return round(float(match.group('number')) * filesize_correlations[unit])
 
-	return filesize_correlations['mb']
+
+# Converter names manifest inside converters directory, generated at build time
+process_types_manifest = "_manifest.txt"
+
+# Discovered converter types, keyed by converters directory
+_process_types_cache: Dict[Tuple[str, str], List[str]] = {}
+
+
+def iter_process_types(path: str, prefix: str = "") -> Iterator[str]:
+	"""
+	Lazily discover converter type names in converters directory.
+	
+	Only names are yielded, no converter module gets imported here.
+	
+	Args:
+		path: Directory path to search for converters
+		prefix: Prefix for nested package names
+		
+	Yields:
+		str: Discovered converter type name (e.g., "txt.bulk")
+	"""
+	with os.scandir(path) as entries:
+		for entry in entries:
+			if entry.name[0] == "_":
+				continue
+			
+			if entry.is_file():
+				if entry.name.split(".")[-1] == "py":
+					yield prefix+entry.name.split(".")[0]
+			elif entry.is_dir():
+				yield from iter_process_types(entry.path, prefix+entry.name+".")
 
 
 def get_all_process_types(path: str, prefix: str = "") -> List[str]:
 	"""
 	Recursively discover all available converter types in converters directory.
 	
+	Installed package ships a manifest with converter names (generated at build
+	time, see setup.py), so the directory is scanned only when it is missing.
+	The result is memoized, so discovery runs only once per process.
+	
 	Args:
 		path: Directory path to search for converters
 		prefix: Prefix for nested package names
@@ -133,16 +510,15 @@ def get_all_process_types(path: str, prefix: str = "") -> List[str]:
 	Returns:
 		List[str]: List of discovered converter type names
 	"""
-	processes = []
+	key = (path, prefix)
 	
-	for part in listdir(path):
-		if part[0] == "_":
-			continue
+	if key not in _process_types_cache:
+		try:
+			with open(os.path.join(path, process_types_manifest), encoding='utf-8') as f:
+				process_types = [prefix+name for name in f.read().splitlines() if name]
+		except OSError:
+			process_types = list(iter_process_types(path, prefix))
 		
-		if os.path.isfile(os.path.join(path, part)):
-			if part.split(".")[-1] == "py":
-				processes.append(prefix+part.split(".")[0])
-		else:
-			processes += get_all_process_types(os.path.join(path, part), prefix+part+".")
+		_process_types_cache[key] = process_types
 	
-	return processes
\ No newline at end of file
+	return _process_types_cache[key]